@@ -1,5 +1,6 @@
 import json
 import logging
+from functools import lru_cache
 from fastapi import HTTPException, Request
 from fastapi.security import HTTPBearer
 from fastapi.responses import JSONResponse
@@ -19,12 +20,15 @@ logger = logging.getLogger(__name__)
 # Security scheme for Bearer token
 security = HTTPBearer()
 
-# Initialize ScaleKit client
-scalekit_client = ScalekitClient(
-    settings.SCALEKIT_ENVIRONMENT_URL,
-    settings.SCALEKIT_CLIENT_ID,
-    settings.SCALEKIT_CLIENT_SECRET
-)
+# Initialize ScaleKit client on first use, so the stdio transport (which has no
+# auth layer) can start without ScaleKit configuration
+@lru_cache(maxsize=1)
+def get_scalekit_client() -> ScalekitClient:
+    return ScalekitClient(
+        settings.SCALEKIT_ENVIRONMENT_URL,
+        settings.SCALEKIT_CLIENT_ID,
+        settings.SCALEKIT_CLIENT_SECRET
+    )
 
 # Authentication middleware
 class AuthMiddleware(BaseHTTPMiddleware):
@@ -60,7 +64,7 @@ class AuthMiddleware(BaseHTTPMiddleware):
                 validation_options.required_scopes = required_scopes  
             
             try:
-                scalekit_client.validate_token(token, options=validation_options)
+                get_scalekit_client().validate_token(token, options=validation_options)
                 
             except Exception as e:
                 raise HTTPException(status_code=401, detail="Token validation failed")
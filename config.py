@@ -18,6 +18,12 @@ class Settings:
     # Server Port
     PORT: int = int(os.environ.get("PORT", 10000))
 
+    # MCP transport: "streamable-http" for remote clients, "stdio" for local ones
+    MCP_TRANSPORT: str = os.environ.get("MCP_TRANSPORT", "streamable-http")
+
+    # Seconds an idle HTTP keep-alive connection is held open
+    KEEP_ALIVE_TIMEOUT: int = int(os.environ.get("KEEP_ALIVE_TIMEOUT", 30))
+
     def __post_init__(self):
         if not self.SCALEKIT_CLIENT_ID:
             raise ValueError("SCALEKIT_CLIENT_ID environment variable not set")
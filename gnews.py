@@ -2,9 +2,10 @@
 GNews API MCP Server
 
 This server provides access to the GNews API through the Model Context Protocol (MCP).
-It exposes two main tools for fetching news data:
+It exposes three main tools for fetching news data:
 1. search_news - Search for news articles with specific keywords
 2. get_top_headlines - Get trending news articles by category
+3. search_news_batch - Run several news searches in one call
 
 Features:
 - Full support for GNews API parameters
@@ -14,13 +15,22 @@ Features:
 """
 
 import os
+import time
+import random
+import asyncio
 import logging
-from typing import Optional, Literal, List
-from datetime import datetime
-from enum import Enum
+from functools import partial
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Annotated, Optional, Literal, List
 
 import httpx
-from pydantic import BaseModel, Field, validator
+try:
+    # orjson parses the raw response bytes much faster than the stdlib decoder
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+from pydantic import BaseModel, Field
 from mcp.server.fastmcp import FastMCP
 
 
@@ -32,6 +42,9 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# httpx logs every request URL at INFO, and the URL carries the apikey query param
+logging.getLogger("httpx").setLevel(logging.WARNING)
+
 # Create FastMCP server
 mcp = FastMCP(
     name="gnews-server",
@@ -58,59 +71,291 @@ SUPPORTED_COUNTRIES = {
     "gb": "United Kingdom", "us": "United States"
 }
 
-CATEGORIES = [
-    "general", "world", "nation", "business", "technology", 
+CATEGORY_NAMES = (
+    "general", "world", "nation", "business", "technology",
     "entertainment", "sports", "science", "health"
-]
+)
+
+# Literal types so FastMCP/Pydantic validates codes while parsing tool arguments
+LanguageCode = Literal[tuple(SUPPORTED_LANGUAGES)]
+CountryCode = Literal[tuple(SUPPORTED_COUNTRIES)]
+Category = Literal[CATEGORY_NAMES]
 
-class NewsResponse(BaseModel):
-    """Represents a news API response"""
-    totalArticles: int
-    articles: List[dict]
+# Supported codes as display strings, built once for field descriptions
+_LANG_KEYS_STR = ", ".join(SUPPORTED_LANGUAGES)
+_COUNTRY_KEYS_STR = ", ".join(SUPPORTED_COUNTRIES)
+
+# Tool parameter types, shared by the tool signatures and the SearchQuery model
+SearchKeywords = Annotated[str, Field(description="Search keywords. Use logical operators like AND, OR, NOT. Use quotes for exact phrases.")]
+LanguageParam = Annotated[Optional[LanguageCode], Field(description=f"Language code (2 letters). Supported: {_LANG_KEYS_STR}")]
+CountryParam = Annotated[Optional[CountryCode], Field(description=f"Country code (2 letters). Supported: {_COUNTRY_KEYS_STR}")]
+MaxArticlesParam = Annotated[Optional[int], Field(ge=1, le=100, description="Number of articles to return (1-100)")]
+SearchInParam = Annotated[Optional[str], Field(description="Search in specific fields: title, description, content (comma-separated)")]
+NullableParam = Annotated[Optional[str], Field(description="Allow null values for: description, content, image (comma-separated)")]
+DateFromParam = Annotated[Optional[str], Field(description="Filter articles from this date (ISO 8601 format: YYYY-MM-DDTHH:MM:SS.sssZ)")]
+DateToParam = Annotated[Optional[str], Field(description="Filter articles until this date (ISO 8601 format: YYYY-MM-DDTHH:MM:SS.sssZ)")]
+SortByParam = Annotated[Optional[Literal["publishedAt", "relevance"]], Field(description="Sort by publication date or relevance")]
+PageParam = Annotated[Optional[int], Field(ge=1, description="Page number for pagination")]
+CategoryParam = Annotated[Optional[Category], Field(description="News category")]
+HeadlinesQueryParam = Annotated[Optional[str], Field(description="Additional search keywords to filter headlines")]
+
+_api_key: Optional[str] = None
 
 
 def get_api_key() -> str:
-    """Get the GNews API key from environment variables"""
-    api_key = os.getenv("GNEWS_API_KEY")
-    if not api_key:
-        raise ValueError(
-            "GNEWS_API_KEY environment variable is required. "
-            "Get your free API key from https://gnews.io/"
+    """Get the GNews API key from environment variables (read once per process)"""
+    global _api_key
+    if _api_key is None:
+        api_key = os.getenv("GNEWS_API_KEY")
+        if not api_key:
+            raise ValueError(
+                "GNEWS_API_KEY environment variable is required. "
+                "Get your free API key from https://gnews.io/"
+            )
+        _api_key = api_key
+    return _api_key
+
+
+# Shared HTTP/2 client so keep-alive connections to gnews.io are reused across
+# tool calls and concurrent requests are multiplexed over a single connection.
+# Idle connections expire after 30s, and the whole client is recycled every
+# CLIENT_MAX_AGE_SECONDS so a busy server doesn't stay pinned to one backend
+# behind gnews.io's load balancer indefinitely.
+GNEWS_BASE_URL = "https://gnews.io/api/v4"
+CLIENT_MAX_AGE_SECONDS = float(os.getenv("GNEWS_CLIENT_MAX_AGE", "300"))
+CLIENT_CLOSE_GRACE_SECONDS = 60.0
+
+_client: Optional[httpx.AsyncClient] = None
+_client_created_at = 0.0
+_retired_clients: dict[httpx.AsyncClient, asyncio.Task] = {}
+
+
+def _create_http_client() -> httpx.AsyncClient:
+    """Create a GNews HTTP client with connection pooling limits"""
+    return httpx.AsyncClient(
+        base_url=GNEWS_BASE_URL,
+        params={"apikey": get_api_key()},
+        http2=True,
+        timeout=httpx.Timeout(10.0, connect=5.0),
+        limits=httpx.Limits(
+            max_keepalive_connections=20,
+            max_connections=40,
+            keepalive_expiry=30.0
+        )
+    )
+
+
+async def _close_retired_client(client: httpx.AsyncClient) -> None:
+    """Close a recycled client once requests still using it have had time to finish"""
+    try:
+        await asyncio.sleep(CLIENT_CLOSE_GRACE_SECONDS)
+        await client.aclose()
+    finally:
+        _retired_clients.pop(client, None)
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Get the shared GNews HTTP client, creating or recycling it as needed"""
+    global _client, _client_created_at
+    now = time.monotonic()
+    if _client is not None and now - _client_created_at >= CLIENT_MAX_AGE_SECONDS:
+        logger.info("Recycling GNews HTTP client after %.0fs", now - _client_created_at)
+        old_client = _client
+        _retired_clients[old_client] = asyncio.get_running_loop().create_task(
+            _close_retired_client(old_client)
         )
-    return api_key
+        _client = None
+    if _client is None:
+        _client = _create_http_client()
+        _client_created_at = now
+    return _client
+
+
+async def close_http_client() -> None:
+    """Close the shared GNews HTTP client and any recycled ones (called on server shutdown)"""
+    global _client
+    for retired_client, task in list(_retired_clients.items()):
+        task.cancel()
+        await retired_client.aclose()
+    _retired_clients.clear()
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+class TokenBucket:
+    """Token-bucket rate limiter that queues callers until a request slot is free"""
+
+    def __init__(self, requests_per_minute: float, burst: float = 1):
+        if requests_per_minute <= 0:
+            raise ValueError(f"GNEWS_RPM must be greater than 0, got {requests_per_minute}")
+        if burst < 1:
+            raise ValueError(f"GNEWS_BURST must be at least 1, got {burst}")
+        self.capacity = burst
+        self.refill_rate = requests_per_minute / 60.0
+        self.tokens = burst
+        self.last_refill = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.refill_rate)
+        self.last_refill = now
+
+    async def acquire(self) -> None:
+        """Wait until a token is available and consume it"""
+        async with self._lock:
+            self._refill()
+            if self.tokens < 1:
+                wait = (1 - self.tokens) / self.refill_rate
+                logger.info("Rate limit reached, waiting %.2fs before calling GNews API", wait)
+                await asyncio.sleep(wait)
+                self._refill()
+            self.tokens -= 1
+
+
+# Local rate limiting keeps bursts of tool calls under the account quota instead
+# of spending round trips on 429 responses. GNews also enforces a per-second
+# limit, so only GNEWS_BURST requests may leave back to back; this also paces
+# the searches in a search_news_batch call (raise it on plans that allow more
+# requests per second to let a batch go out at once). 429 and 5xx
+# responses are retried with exponential backoff and jitter, or after the
+# server's Retry-After delay when one is given.
+GNEWS_RPM = float(os.getenv("GNEWS_RPM", "60"))
+GNEWS_BURST = float(os.getenv("GNEWS_BURST", "1"))
+MAX_ATTEMPTS = 3
+ERROR_BODY_MAX_BYTES = 512
+RETRY_BASE_DELAY = 0.5
+RETRY_AFTER_MAX_SECONDS = 30.0
+
+_rate_limiter = TokenBucket(GNEWS_RPM, GNEWS_BURST)
+
+
+def _is_retryable(status_code: int) -> bool:
+    """Check whether a GNews API status code is worth retrying"""
+    return status_code == 429 or status_code >= 500
+
+
+def _retry_delay(response: httpx.Response, attempt: int) -> Optional[float]:
+    """
+    Get the delay before retrying a failed request.
+
+    Honors a Retry-After header (seconds or HTTP date) and falls back to exponential
+    backoff with jitter. Returns None when the server asks for a longer wait than
+    RETRY_AFTER_MAX_SECONDS, in which case the request should not be retried.
+    """
+    retry_after = response.headers.get("retry-after")
+    if retry_after:
+        try:
+            delay = float(retry_after)
+        except ValueError:
+            try:
+                delay = (parsedate_to_datetime(retry_after) - datetime.now(timezone.utc)).total_seconds()
+            except (TypeError, ValueError):
+                delay = None
+        if delay is not None:
+            delay = max(delay, 0.0)
+            return delay if delay <= RETRY_AFTER_MAX_SECONDS else None
+    return RETRY_BASE_DELAY * 2 ** (attempt - 1) + random.uniform(0, RETRY_BASE_DELAY)
+
+
+# Short-lived response cache so repeated identical tool calls within a session
+# don't spend a network round trip (or a request from the GNews quota).
+# A TTL of 0 disables caching; concurrent identical calls still share a request.
+CACHE_TTL_SECONDS = float(os.getenv("GNEWS_CACHE_TTL", "60"))
+CACHE_MAX_ENTRIES = 256
+
+_response_cache: dict[tuple, tuple[float, dict]] = {}
+_inflight_requests: dict[tuple, asyncio.Task] = {}
+
+
+def _cache_key(endpoint: str, params: dict) -> tuple:
+    """Build a hashable cache key from the endpoint and request parameters"""
+    return (endpoint, tuple(sorted(params.items())))
+
+
+def _store_cached_response(key: tuple, data: dict) -> None:
+    """Store a response in the cache, evicting stale or oldest entries when full"""
+    now = time.monotonic()
+    if len(_response_cache) >= CACHE_MAX_ENTRIES:
+        for stale_key in [k for k, (ts, _) in _response_cache.items() if now - ts >= CACHE_TTL_SECONDS]:
+            del _response_cache[stale_key]
+        if len(_response_cache) >= CACHE_MAX_ENTRIES:
+            del _response_cache[next(iter(_response_cache))]
+    _response_cache[key] = (now, data)
 
 
 async def make_gnews_request(endpoint: str, params: dict) -> dict:
-    """Make a request to the GNews API"""
-    api_key = get_api_key()
-    
-    # Add API key to parameters
-    params["apikey"] = api_key
-    
-    # Base URL for GNews API
-    base_url = "https://gnews.io/api/v4"
-    url = f"{base_url}/{endpoint}"
-    
+    """
+    Make a request to the GNews API, served from the response cache when possible.
+
+    Concurrent calls with identical parameters share a single in-flight request.
+    The returned dict may be shared between callers and must be treated as read-only.
+    """
+    key = _cache_key(endpoint, params)
+
+    cached = _response_cache.get(key)
+    if cached is not None and time.monotonic() - cached[0] < CACHE_TTL_SECONDS:
+        logger.info("Serving %s request from cache", endpoint)
+        return cached[1]
+
+    task = _inflight_requests.get(key)
+    if task is None:
+        task = asyncio.create_task(_fetch_and_cache(key, endpoint, params))
+        _inflight_requests[key] = task
+        task.add_done_callback(lambda _: _inflight_requests.pop(key, None))
+
+    # Shield so a cancelled caller doesn't cancel the request other callers are awaiting
+    return await asyncio.shield(task)
+
+
+async def _fetch_and_cache(key: tuple, endpoint: str, params: dict) -> dict:
+    """Fetch from the GNews API and cache the successful response"""
+    data = await _fetch_gnews(endpoint, params)
+    if CACHE_TTL_SECONDS > 0:
+        _store_cached_response(key, data)
+    return data
+
+
+async def _fetch_gnews(endpoint: str, params: dict) -> dict:
+    """Perform the HTTP request to the GNews API, retrying on 429 and 5xx responses"""
     try:
-        async with httpx.AsyncClient() as client:
-            logger.info(f"Making request to {endpoint} with params: {params}")
-            response = await client.get(url, params=params)
+        for attempt in range(1, MAX_ATTEMPTS + 1):
+            await _rate_limiter.acquire()
+            client = get_http_client()
+            logger.info("Making request to %s with params: %s", endpoint, params)
+            response = await client.get(endpoint, params=params)
+            logger.debug("GNews response received over %s", response.http_version)
             
             if response.status_code == 200:
-                data = response.json()
-                logger.info(f"Successfully retrieved {data.get('totalArticles', 0)} articles")
+                data = json_loads(response.content)
+                logger.info("Successfully retrieved %s articles", data.get("totalArticles", 0))
                 return data
-            else:
-                error_msg = f"GNews API error: {response.status_code}"
+            
+            delay = _retry_delay(response, attempt) if _is_retryable(response.status_code) else None
+            if delay is not None and attempt < MAX_ATTEMPTS:
+                logger.warning(
+                    "GNews API returned %s, retrying in %.1fs (attempt %s/%s)",
+                    response.status_code, delay, attempt, MAX_ATTEMPTS
+                )
+                await asyncio.sleep(delay)
+                continue
+            
+            error_msg = f"GNews API error: {response.status_code}"
+            error_data = None
+            if "application/json" in response.headers.get("content-type", ""):
                 try:
-                    error_data = response.json()
-                    if "errors" in error_data:
-                        error_msg += f" - {error_data['errors']}"
-                except:
-                    error_msg += f" - {response.text}"
-                
-                logger.error(error_msg)
-                raise Exception(error_msg)
+                    error_data = json_loads(response.content)
+                except ValueError:
+                    pass
+            if isinstance(error_data, dict) and "errors" in error_data:
+                error_msg += f" - {error_data['errors']}"
+            elif error_data is None:
+                # Bound the message size for large non-JSON bodies (e.g. HTML error pages)
+                error_msg += f" - {response.content[:ERROR_BODY_MAX_BYTES].decode(response.encoding or 'utf-8', errors='replace')}"
+            
+            logger.error(error_msg)
+            raise Exception(error_msg)
                 
     except httpx.RequestError as e:
         error_msg = f"Network error connecting to GNews API: {str(e)}"
@@ -118,18 +363,36 @@ async def make_gnews_request(endpoint: str, params: dict) -> dict:
         raise Exception(error_msg)
 
 
+# Endpoint-specific request helpers; endpoints are resolved against the client's base_url
+fetch_search = partial(make_gnews_request, "search")
+fetch_top_headlines = partial(make_gnews_request, "top-headlines")
+
+# (tool argument, GNews API parameter) pairs; arguments left empty are not sent
+_SEARCH_PARAM_MAP = (
+    ("q", "q"), ("lang", "lang"), ("country", "country"), ("max_articles", "max"),
+    ("search_in", "in"), ("nullable", "nullable"), ("date_from", "from"),
+    ("date_to", "to"), ("sortby", "sortby"), ("page", "page")
+)
+
+_HEADLINES_PARAM_MAP = (
+    ("category", "category"), ("lang", "lang"), ("country", "country"),
+    ("max_articles", "max"), ("nullable", "nullable"), ("date_from", "from"),
+    ("date_to", "to"), ("q", "q"), ("page", "page")
+)
+
+
 @mcp.tool()
 async def search_news(
-    q: str = Field(description="Search keywords. Use logical operators like AND, OR, NOT. Use quotes for exact phrases."),
-    lang: Optional[str] = Field(default=None, description=f"Language code (2 letters). Supported: {', '.join(SUPPORTED_LANGUAGES.keys())}"),
-    country: Optional[str] = Field(default=None, description=f"Country code (2 letters). Supported: {', '.join(SUPPORTED_COUNTRIES.keys())}"),
-    max_articles: Optional[int] = Field(default=10, description="Number of articles to return (1-100)"),
-    search_in: Optional[str] = Field(default=None, description="Search in specific fields: title, description, content (comma-separated)"),
-    nullable: Optional[str] = Field(default=None, description="Allow null values for: description, content, image (comma-separated)"),
-    date_from: Optional[str] = Field(default=None, description="Filter articles from this date (ISO 8601 format: YYYY-MM-DDTHH:MM:SS.sssZ)"),
-    date_to: Optional[str] = Field(default=None, description="Filter articles until this date (ISO 8601 format: YYYY-MM-DDTHH:MM:SS.sssZ)"),
-    sortby: Optional[Literal["publishedAt", "relevance"]] = Field(default="publishedAt", description="Sort by publication date or relevance"),
-    page: Optional[int] = Field(default=1, description="Page number for pagination")
+    q: SearchKeywords,
+    lang: LanguageParam = None,
+    country: CountryParam = None,
+    max_articles: MaxArticlesParam = 10,
+    search_in: SearchInParam = None,
+    nullable: NullableParam = None,
+    date_from: DateFromParam = None,
+    date_to: DateToParam = None,
+    sortby: SortByParam = "publishedAt",
+    page: PageParam = 1
 ) -> dict:
     """
     Search for news articles using specific keywords.
@@ -147,43 +410,12 @@ async def search_news(
     content, URL, image, publishedAt, and source information.
     """
     
-    # Validate parameters
-    if lang and lang not in SUPPORTED_LANGUAGES:
-        raise ValueError(f"Unsupported language '{lang}'. Supported languages: {', '.join(SUPPORTED_LANGUAGES.keys())}")
-    
-    if country and country not in SUPPORTED_COUNTRIES:
-        raise ValueError(f"Unsupported country '{country}'. Supported countries: {', '.join(SUPPORTED_COUNTRIES.keys())}")
-    
-    if max_articles and (max_articles < 1 or max_articles > 100):
-        raise ValueError("Max articles must be between 1 and 100")
-    
-    if page and page < 1:
-        raise ValueError("Page must be 1 or greater")
-    
     # Build request parameters
-    params = {"q": q}
-    
-    if lang:
-        params["lang"] = lang
-    if country:
-        params["country"] = country
-    if max_articles:
-        params["max"] = max_articles
-    if search_in:
-        params["in"] = search_in
-    if nullable:
-        params["nullable"] = nullable
-    if date_from:
-        params["from"] = date_from
-    if date_to:
-        params["to"] = date_to
-    if sortby:
-        params["sortby"] = sortby
-    if page:
-        params["page"] = page
+    args = locals()
+    params = {api_name: args[arg] for arg, api_name in _SEARCH_PARAM_MAP if args[arg]}
     
     try:
-        result = await make_gnews_request("search", params)
+        result = await fetch_search(params)
         return {
             "success": True,
             "query": q,
@@ -202,18 +434,15 @@ async def search_news(
 
 @mcp.tool()
 async def get_top_headlines(
-    category: Optional[Literal["general", "world", "nation", "business", "technology", "entertainment", "sports", "science", "health"]] = Field(
-        default="general", 
-        description="News category"
-    ),
-    lang: Optional[str] = Field(default=None, description=f"Language code (2 letters). Supported: {', '.join(SUPPORTED_LANGUAGES.keys())}"),
-    country: Optional[str] = Field(default=None, description=f"Country code (2 letters). Supported: {', '.join(SUPPORTED_COUNTRIES.keys())}"),
-    max_articles: Optional[int] = Field(default=10, description="Number of articles to return (1-100)"),
-    nullable: Optional[str] = Field(default=None, description="Allow null values for: description, content, image (comma-separated)"),
-    date_from: Optional[str] = Field(default=None, description="Filter articles from this date (ISO 8601 format: YYYY-MM-DDTHH:MM:SS.sssZ)"),
-    date_to: Optional[str] = Field(default=None, description="Filter articles until this date (ISO 8601 format: YYYY-MM-DDTHH:MM:SS.sssZ)"),
-    q: Optional[str] = Field(default=None, description="Additional search keywords to filter headlines"),
-    page: Optional[int] = Field(default=1, description="Page number for pagination")
+    category: CategoryParam = "general",
+    lang: LanguageParam = None,
+    country: CountryParam = None,
+    max_articles: MaxArticlesParam = 10,
+    nullable: NullableParam = None,
+    date_from: DateFromParam = None,
+    date_to: DateToParam = None,
+    q: HeadlinesQueryParam = None,
+    page: PageParam = 1
 ) -> dict:
     """
     Get current trending news articles based on Google News ranking.
@@ -236,47 +465,13 @@ async def get_top_headlines(
     Returns a structured response with trending article details.
     """
     
-    # Validate parameters
-    if category and category not in CATEGORIES:
-        raise ValueError(f"Unsupported category '{category}'. Supported categories: {', '.join(CATEGORIES)}")
-    
-    if lang and lang not in SUPPORTED_LANGUAGES:
-        raise ValueError(f"Unsupported language '{lang}'. Supported languages: {', '.join(SUPPORTED_LANGUAGES.keys())}")
-    
-    if country and country not in SUPPORTED_COUNTRIES:
-        raise ValueError(f"Unsupported country '{country}'. Supported countries: {', '.join(SUPPORTED_COUNTRIES.keys())}")
-    
-    if max_articles and (max_articles < 1 or max_articles > 100):
-        raise ValueError("Max articles must be between 1 and 100")
-    
-    if page and page < 1:
-        raise ValueError("Page must be 1 or greater")
-    
     # Build request parameters
-    params = {}
-    
-    if category:
-        params["category"] = category
-    if lang:
-        params["lang"] = lang
-    if country:
-        params["country"] = country
-    if max_articles:
-        params["max"] = max_articles
-    if nullable:
-        params["nullable"] = nullable
-    if date_from:
-        params["from"] = date_from
-    if date_to:
-        params["to"] = date_to
-    if q:
-        params["q"] = q
-    if page:
-        params["page"] = page
+    args = locals()
+    params = {api_name: args[arg] for arg, api_name in _HEADLINES_PARAM_MAP if args[arg]}
     
     try:
-        logger.info(f"Getting top headlines for category '{category}' with params: {params}")
-        result = await make_gnews_request("top-headlines", params)
+        logger.info("Getting top headlines for category '%s' with params: %s", category, params)
+        result = await fetch_top_headlines(params)
         return {
             "success": True,
             "category": category or "general",
@@ -291,3 +486,47 @@ async def get_top_headlines(
             "category": category or "general",
             "parameters_used": params
         }
+
+
+class SearchQuery(BaseModel):
+    """A single search in a search_news_batch call (same arguments as search_news)"""
+    q: SearchKeywords
+    lang: LanguageParam = None
+    country: CountryParam = None
+    max_articles: MaxArticlesParam = 10
+    search_in: SearchInParam = None
+    nullable: NullableParam = None
+    date_from: DateFromParam = None
+    date_to: DateToParam = None
+    sortby: SortByParam = "publishedAt"
+    page: PageParam = 1
+
+
+@mcp.tool()
+async def search_news_batch(
+    queries: List[SearchQuery] = Field(
+        min_length=1,
+        max_length=10,
+        description="Searches to run, each with the same arguments as search_news (up to 10)"
+    )
+) -> dict:
+    """
+    Run several news searches in one tool call and return all results at once.
+    
+    Use this instead of calling search_news repeatedly when researching a topic
+    from several angles (e.g. different keywords, languages or date ranges).
+    Searches still go through the server's GNews rate limit: with the default
+    settings they are sent about one per second, so a batch takes roughly as
+    long as the same searches made one after another. Identical searches in a
+    batch are fetched only once, and recently made searches come from cache.
+    
+    Returns one result per query, in the same order, each shaped like a
+    search_news response. A failed search yields an entry with success set to
+    false; the other searches are unaffected.
+    """
+    
+    # search_news turns request errors into success: false results, so gather only
+    # raises on cancellation, which should propagate
+    results = await asyncio.gather(*(search_news(**query.model_dump()) for query in queries))
+    
+    return {"results": results}
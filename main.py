@@ -1,18 +1,23 @@
+import asyncio
 import contextlib
+import sys
 import uvicorn
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from auth import AuthMiddleware
 from config import settings
-from gnews import mcp as gnews_mcp_server
+from gnews import mcp as gnews_mcp_server, close_http_client
 import json
 
 # Create a combined lifespan to manage the MCP session manager
 @contextlib.asynccontextmanager
 async def lifespan(app: FastAPI):
     async with gnews_mcp_server.session_manager.run():
-        yield
+        try:
+            yield
+        finally:
+            await close_http_client()
 
 app = FastAPI(lifespan=lifespan)
 
@@ -41,9 +46,44 @@ mcp_server = gnews_mcp_server.streamable_http_app()
 app.add_middleware(AuthMiddleware)
 app.mount("/", mcp_server)
 
+def install_uvloop():
+    """Use uvloop as the asyncio event loop when it is installed (not available on Windows)."""
+    if sys.platform == "win32":
+        return
+    try:
+        import uvloop
+    except ImportError:
+        return
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+SUPPORTED_TRANSPORTS = ("streamable-http", "stdio")
+
+async def run_stdio():
+    """Serve MCP over stdio for local clients, closing the GNews HTTP client on exit."""
+    try:
+        await gnews_mcp_server.run_stdio_async()
+    finally:
+        await close_http_client()
+
 def main():
     """Main entry point for the MCP server."""
-    uvicorn.run(app, host="0.0.0.0", port=settings.PORT, log_level="debug")
+    if settings.MCP_TRANSPORT not in SUPPORTED_TRANSPORTS:
+        raise ValueError(
+            f"Unsupported MCP_TRANSPORT '{settings.MCP_TRANSPORT}'. "
+            f"Supported transports: {', '.join(SUPPORTED_TRANSPORTS)}"
+        )
+    install_uvloop()
+    if settings.MCP_TRANSPORT == "stdio":
+        # Local clients talk to the server over stdio, no HTTP layer involved
+        asyncio.run(run_stdio())
+    else:
+        uvicorn.run(
+            app,
+            host="0.0.0.0",
+            port=settings.PORT,
+            log_level="debug",
+            timeout_keep_alive=settings.KEEP_ALIVE_TIMEOUT,
+        )
 
 if __name__ == "__main__":
     main()
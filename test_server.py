@@ -6,14 +6,215 @@ Run this to verify the server is working correctly
 
 import os
 import sys
+import time
 import asyncio
+import contextlib
 import json
 from pathlib import Path
 
+import httpx
+
 # Add the current directory to the path to import main
 sys.path.insert(0, str(Path(__file__).parent))
 
-from main import mcp, get_api_key
+import gnews
+from gnews import mcp, get_api_key
+from mcp.server.fastmcp.exceptions import ToolError
+
+
+# Module state in gnews that the offline checks replace, with the values each
+# scenario starts from (tuning knobs shrunk so the checks run fast)
+MOCK_GNEWS_SETTINGS = {
+    "CACHE_TTL_SECONDS": 60.0,
+    "CACHE_MAX_ENTRIES": 256,
+    "RETRY_BASE_DELAY": 0.01,
+    "CLIENT_MAX_AGE_SECONDS": 300.0,
+    "CLIENT_CLOSE_GRACE_SECONDS": 60.0,
+}
+MOCK_GNEWS_STATE = ("_api_key", "_client", "_client_created_at", "_rate_limiter")
+MOCK_GNEWS_CONTAINERS = ("_response_cache", "_inflight_requests", "_retired_clients")
+
+
+@contextlib.asynccontextmanager
+async def mock_gnews(handler, rate_limiter=None, **settings):
+    """
+    Point the shared GNews client at an httpx.MockTransport for one scenario.
+
+    The cache, rate limiter and tuning knobs are reset for the scenario (keyword
+    arguments override MOCK_GNEWS_SETTINGS), and every gnews global touched here
+    is restored on exit so later checks see the module as it was.
+    """
+    saved = {name: getattr(gnews, name) for name in (*MOCK_GNEWS_SETTINGS, *MOCK_GNEWS_STATE)}
+    saved_containers = {name: dict(getattr(gnews, name)) for name in MOCK_GNEWS_CONTAINERS}
+    try:
+        for name in MOCK_GNEWS_CONTAINERS:
+            getattr(gnews, name).clear()
+        for name, value in {**MOCK_GNEWS_SETTINGS, **settings}.items():
+            setattr(gnews, name, value)
+        gnews._api_key = "test-key"
+        gnews._client = httpx.AsyncClient(
+            base_url=gnews.GNEWS_BASE_URL,
+            params={"apikey": gnews._api_key},
+            transport=httpx.MockTransport(handler)
+        )
+        gnews._client_created_at = time.monotonic()
+        gnews._rate_limiter = rate_limiter or gnews.TokenBucket(60000, burst=1000)
+        yield
+    finally:
+        await gnews.close_http_client()
+        for name, value in saved.items():
+            setattr(gnews, name, value)
+        for name, contents in saved_containers.items():
+            container = getattr(gnews, name)
+            container.clear()
+            container.update(contents)
+
+
+def ok_response(request):
+    return httpx.Response(200, json={"totalArticles": 1, "articles": [{"title": str(request.url.params)}]})
+
+
+async def test_request_pipeline():
+    """Test caching, request sharing, retries and client recycling without calling GNews"""
+    print("\n🔌 Testing request pipeline (offline)")
+    print("=" * 50)
+    passed = True
+
+    def check(condition, message):
+        nonlocal passed
+        print(f"{'✅' if condition else '❌'} {message}")
+        passed = passed and condition
+
+    # Cache hits within the TTL and refetches after it expires
+    hits = []
+    async with mock_gnews(lambda request: hits.append(request) or ok_response(request), CACHE_TTL_SECONDS=0.1):
+        first = await gnews.make_gnews_request("search", {"q": "ai"})
+        second = await gnews.make_gnews_request("search", {"q": "ai"})
+        check(len(hits) == 1 and first == second, "Identical requests within the TTL are served from cache")
+        await asyncio.sleep(0.15)
+        await gnews.make_gnews_request("search", {"q": "ai"})
+        check(len(hits) == 2, "Expired cache entries are fetched again")
+
+    # A TTL of 0 disables caching
+    hits = []
+    async with mock_gnews(lambda request: hits.append(request) or ok_response(request), CACHE_TTL_SECONDS=0.0):
+        await gnews.make_gnews_request("search", {"q": "ai"})
+        await gnews.make_gnews_request("search", {"q": "ai"})
+        check(len(hits) == 2 and not gnews._response_cache, "GNEWS_CACHE_TTL=0 disables caching")
+
+    # Concurrent identical requests share one in-flight request
+    hits = []
+
+    async def slow_handler(request):
+        hits.append(request)
+        await asyncio.sleep(0.05)
+        return ok_response(request)
+
+    async with mock_gnews(slow_handler):
+        results = await asyncio.gather(*(gnews.make_gnews_request("search", {"q": "ai"}) for _ in range(5)))
+        check(len(hits) == 1 and all(r == results[0] for r in results), "Concurrent identical requests share one fetch")
+        check(not gnews._inflight_requests, "In-flight request is cleared once it completes")
+
+    # Oldest entry is evicted once the cache is full
+    async with mock_gnews(ok_response, CACHE_MAX_ENTRIES=3):
+        for query in ("a", "b", "c", "d"):
+            await gnews.make_gnews_request("search", {"q": query})
+        cached_queries = [dict(key[1])["q"] for key in gnews._response_cache]
+        check(cached_queries == ["b", "c", "d"], "Oldest cache entry is evicted at CACHE_MAX_ENTRIES")
+
+    # 429 and 5xx responses are retried, honoring Retry-After
+    statuses = iter([503, 429, 200])
+    hits = []
+
+    def flaky_handler(request):
+        hits.append(request)
+        status = next(statuses)
+        if status == 200:
+            return ok_response(request)
+        return httpx.Response(status, headers={"retry-after": "0"} if status == 429 else {})
+
+    async with mock_gnews(flaky_handler):
+        result = await gnews.make_gnews_request("search", {"q": "ai"})
+        check(len(hits) == 3 and result["totalArticles"] == 1, "429/5xx responses are retried until success")
+
+    hits = []
+    async with mock_gnews(lambda request: hits.append(request) or httpx.Response(500, text="<html>down</html>")):
+        try:
+            await gnews.make_gnews_request("search", {"q": "ai"})
+            check(False, "Persistent 5xx responses raise an error")
+        except Exception as e:
+            check(len(hits) == gnews.MAX_ATTEMPTS and "500" in str(e), f"Persistent 5xx responses give up after {gnews.MAX_ATTEMPTS} attempts")
+
+    hits = []
+    async with mock_gnews(lambda request: hits.append(request) or httpx.Response(400, json={"errors": ["bad query"]})):
+        result = await gnews.search_news(q="ai")
+        check(len(hits) == 1 and not result["success"] and "bad query" in result["error"], "Client errors are not retried")
+
+    # The rate limiter spaces requests once the burst is used up
+    request_times = []
+    limiter = gnews.TokenBucket(600, burst=1)
+    async with mock_gnews(lambda request: request_times.append(time.monotonic()) or ok_response(request), rate_limiter=limiter):
+        for query in ("a", "b", "c"):
+            await gnews.make_gnews_request("search", {"q": query})
+        gaps = [later - earlier for earlier, later in zip(request_times, request_times[1:])]
+        check(len(gaps) == 2 and all(gap >= 0.09 for gap in gaps), "Rate limiter waits between requests beyond the burst")
+
+    # Old clients are recycled and closed after the grace period
+    async with mock_gnews(ok_response, CLIENT_CLOSE_GRACE_SECONDS=0.05):
+        old_client = gnews.get_http_client()
+        gnews.CLIENT_MAX_AGE_SECONDS = 0.0
+        new_client = gnews.get_http_client()
+        check(new_client is not old_client and old_client in gnews._retired_clients, "Expired client is replaced")
+        await asyncio.sleep(0.1)
+        check(old_client.is_closed and old_client not in gnews._retired_clients, "Retired client is closed after the grace period")
+
+    # search_news_batch keeps query order, isolates failures and shares duplicate fetches
+    hits = []
+
+    def batch_handler(request):
+        hits.append(request)
+        if request.url.params["q"] == "bad":
+            return httpx.Response(400, json={"errors": ["bad query"]})
+        return ok_response(request)
+
+    async with mock_gnews(batch_handler):
+        queries = [gnews.SearchQuery(q=q) for q in ("first", "bad", "second", "first")]
+        batch = await gnews.search_news_batch(queries)
+        results = batch["results"]
+        check([r["query"] for r in results] == ["first", "bad", "second", "first"], "Batch results come back in query order")
+        check(
+            not results[1]["success"] and "bad query" in results[1]["error"]
+            and all(results[i]["success"] for i in (0, 2, 3)),
+            "A failing batch query returns an error entry without failing the others"
+        )
+        check(len(hits) == 3, "Duplicate batch queries share one fetch")
+
+    # FastMCP rejects invalid arguments before any request is made
+    hits = []
+    invalid_calls = [
+        ("search_news", {"q": "ai", "lang": "xx"}),
+        ("search_news", {"q": "ai", "country": "xx"}),
+        ("search_news", {"q": "ai", "max_articles": 101}),
+        ("search_news", {"q": "ai", "page": 0}),
+        ("get_top_headlines", {"category": "gossip"}),
+    ]
+    async with mock_gnews(lambda request: hits.append(request) or ok_response(request)):
+        for tool_name, arguments in invalid_calls:
+            try:
+                await mcp.call_tool(tool_name, arguments)
+                rejected = False
+            except ToolError:
+                rejected = True
+            check(rejected, f"{tool_name} rejects invalid arguments {arguments}")
+        check(not hits, "Invalid arguments never reach the GNews API")
+
+    # Every scenario leaves the module as it found it
+    check(
+        gnews.CLIENT_MAX_AGE_SECONDS != 0.0 and gnews._client is None and gnews._api_key is None
+        and not gnews._response_cache and gnews._rate_limiter.refill_rate == gnews.GNEWS_RPM / 60.0,
+        "gnews module state is restored after the offline checks"
+    )
+    return passed
 
 
 async def test_server():
@@ -35,7 +236,7 @@ async def test_server():
     print("\n2. Testing tool registration...")
     tools = await mcp.list_tools()
     tool_names = [tool.name for tool in tools]
-    expected_tools = ["search_news", "get_top_headlines"]
+    expected_tools = ["search_news", "get_top_headlines", "search_news_batch"]
     
     for tool_name in expected_tools:
         if tool_name in tool_names:
@@ -153,6 +354,11 @@ if __name__ == "__main__":
         print("\n❌ Environment test failed")
         sys.exit(1)
     
+    # Test the request pipeline offline (no API key needed)
+    if not asyncio.run(test_request_pipeline()):
+        print("\n❌ Request pipeline test failed")
+        sys.exit(1)
+    
     # Test server functionality
     try:
         result = asyncio.run(test_server())